@@ -42,14 +42,19 @@ SCENE_DURATION_SECONDS = 12.0  # time each fact is shown
 FADE_DURATION_SECONDS = 1.5  # fade in/out time for each scene
 BACKGROUND_MUSIC_FILE = ASSETS_DIR / "background_music.mp3"
 
+# Set CC_STATIC_RENDER=1 to skip per-frame Python rendering entirely and let
+# FFmpeg animate the scene fades from a handful of baked PNGs. Much faster,
+# but drops the sparkle animation and uses linear (not eased) fades.
+STATIC_RENDER = os.environ.get("CC_STATIC_RENDER", "") == "1"
+
 # ── YouTube Settings ─────────────────────────────────────────────────────────
-YOUTUBE_TAGS = [
+YOUTUBE_TAGS = (
     "coffee", "caffeine", "didyouknow", "facts", "shorts",
     "coffeefacts", "caffeinefacts", "coffeelovers", "coffeetok",
     "coffeetime", "coffeeaddict", "espresso", "barista",
     "morningcoffee", "coffeeshop", "latte", "coffeeholic",
     "funfacts", "dailyfacts", "themoreyouknow",
-]
+)
 YOUTUBE_CATEGORY_ID = "22"  # People & Blogs
 YOUTUBE_PRIVACY = "public"  # "public", "unlisted", or "private"
 YOUTUBE_DESCRIPTION_TEMPLATE = (
@@ -3,12 +3,19 @@ Caffeine Chronicles — Content Generator
 Uses MiniMax M2.5 API to generate fresh, unique content daily.
 Generates 3 pieces of content per video, rotating through categories.
 """
-import json
+import functools
+import itertools
+import os
 import re
 import random
+from collections import deque
 from pathlib import Path
+
+import httpx
+import orjson
 from openai import OpenAI
 
+from fact_bank import FACTS, COFFEE_SHOPS
 from config import (
     STATE_FILE, OUTPUT_DIR, CHANNEL_NAME,
     MINIMAX_API_KEY, MINIMAX_BASE_URL, MINIMAX_MODEL,
@@ -96,6 +103,15 @@ Reply with ONLY the recommendations, one per line, numbered like:
 3. [shop]""",
 }
 
+# The channel name never changes, so bake it into each prompt once at
+# import; the remaining placeholders are filled with plain str.replace,
+# skipping format-string parsing on every call.
+_PROMPTS = {k: v.replace("{channel}", CHANNEL_NAME) for k, v in PROMPTS.items()}
+
+# Precompiled patterns used in the response-parsing hot path.
+_THINK = re.compile(r"<think>.*?</think>", re.DOTALL)
+_QUOTED = re.compile(r'"([^"]{20,})"')
+
 FALLBACK_FACTS = [
     "Coffee is the world's most popular psychoactive substance, consumed by over 2 billion people daily.",
     "A single coffee tree produces only about 1 pound of roasted coffee per year.",
@@ -103,23 +119,108 @@ FALLBACK_FACTS = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
+def _get_client(api_key: str, base_url: str) -> OpenAI:
+    """Build the MiniMax client once and reuse its connection pool across calls.
+
+    HTTP/2 lets burst/backfill generation multiplex requests over a single
+    kept-alive connection instead of paying TCP+TLS setup per call.
+    """
+    http_client = httpx.Client(
+        http2=True,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+# How many past items we remember for de-duplication prompts.
+HISTORY_LIMIT = 200
+
+# Resolve the state paths to plain strings once; save_state runs per
+# episode and the Path machinery is pure overhead there.
+_STATE_PATH = os.fspath(STATE_FILE)
+_STATE_TMP = _STATE_PATH + ".tmp"
+
+# Set once the output directory is known to exist, so batch runs don't
+# repeat the stat+mkdir syscalls every episode.
+_OUTPUT_READY = False
+
+
 def load_state() -> dict:
-    if STATE_FILE.exists():
-        return json.loads(STATE_FILE.read_text())
-    return {"episode": 0, "history": []}
+    if os.path.exists(_STATE_PATH):
+        with open(_STATE_PATH, "rb") as f:
+            state = orjson.loads(f.read())
+    else:
+        state = {"episode": 0, "history": []}
+    # A bounded deque auto-evicts old entries on append — no size check
+    # or reslice copy per episode.
+    state["history"] = deque(state.get("history", []), maxlen=HISTORY_LIMIT)
+    return state
 
 
 def save_state(state: dict) -> None:
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+    """Atomically rewrite state.json (tmp file + rename)."""
+    payload = dict(state)
+    payload["history"] = list(state.get("history", ()))
+    with open(_STATE_TMP, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(_STATE_TMP, _STATE_PATH)
+
+
+class StateStore:
+    """Holds state.json in memory for a whole session.
+
+    Loads once on entry and saves once on clean exit, so a caller making
+    several run() invocations (backfills, test sweeps) skips the per-call
+    disk read, JSON parse, and rewrite.
+    """
+
+    def __enter__(self) -> dict:
+        self.state = load_state()
+        return self.state
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            save_state(self.state)
+
+
+def pick_from_bank(bank: list[str], state: dict, key: str) -> str:
+    """Pick an unused item from a bank in O(1).
+
+    State keeps a pre-shuffled queue of unused indices (``unused_<key>``);
+    each pick pops from the end, and the queue is reshuffled and refilled
+    once the bank is exhausted.
+    """
+    unused_key = f"unused_{key}"
+    queue = state.get(unused_key)
+    if not queue:
+        # Honor the legacy used_<key> list (old schema) once on refill,
+        # then drop it — membership is checked against a set built here
+        # a single time, never per pick.
+        used = set(state.pop(f"used_{key}", ()))
+        queue = [i for i in range(len(bank)) if i not in used]
+        if not queue:  # full cycle complete — start over
+            queue = list(range(len(bank)))
+        random.shuffle(queue)
+        state[unused_key] = queue
+    return bank[queue.pop()]
 
 
 def parse_numbered_list(text: str, expected_count: int) -> list[str]:
     """Parse a numbered list response into individual items."""
-    lines = text.strip().split("\n")
     items = []
-    for line in lines:
-        # Strip numbering like "1. ", "2) ", "1: ", etc.
-        cleaned = re.sub(r"^\s*\d+[\.\)\:\-]\s*", "", line).strip()
+    for line in text.splitlines():
+        # Strip numbering like "1. ", "2) ", "1: ", etc. — a manual scan,
+        # since the grammar is trivial and this runs once per line.
+        s = line.lstrip()
+        i = 0
+        while i < len(s) and s[i].isdigit():
+            i += 1
+        if i and i < len(s) and s[i] in ".):-":
+            cleaned = s[i + 1:].strip()
+        else:
+            cleaned = s.rstrip()
         if cleaned and len(cleaned) > 15:
             items.append(cleaned)
     return items[:expected_count]
@@ -132,15 +233,16 @@ def generate_content(content_type: str, count: int, history: list[str]) -> list[
         print("[ContentGen] WARNING: MINIMAX_API_KEY is empty! Using fallback facts.")
         return FALLBACK_FACTS[:count]
 
-    client = OpenAI(api_key=key, base_url=MINIMAX_BASE_URL)
+    client = _get_client(key, MINIMAX_BASE_URL)
 
-    recent = history[-40:]
-    history_block = "\n".join(f"- {h}" for h in recent) if recent else "(none yet)"
+    recent = list(history)[-40:]
+    # str.join fast-paths list input, so build a list rather than a generator
+    history_block = "\n".join(["- " + h for h in recent]) if recent else "(none yet)"
 
-    prompt = PROMPTS[content_type].format(
-        channel=CHANNEL_NAME,
-        history=history_block,
-        count=count,
+    prompt = (
+        _PROMPTS[content_type]
+        .replace("{history}", history_block)
+        .replace("{count}", str(count))
     )
 
     response = client.chat.completions.create(
@@ -160,16 +262,18 @@ def generate_content(content_type: str, count: int, history: list[str]) -> list[
     )
 
     text = (response.choices[0].message.content or "").strip()
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    text = _THINK.sub("", text).strip()
 
     # If empty, try extracting from reasoning
     if not text:
         reasoning = getattr(response.choices[0].message, "reasoning_details", None)
         if reasoning and isinstance(reasoning, list):
             raw = reasoning[0].get("text", "") if isinstance(reasoning[0], dict) else str(reasoning[0])
-            quoted = re.findall(r'"([^"]{20,})"', raw)
+            # finditer + islice stops scanning the (multi-KB) reasoning
+            # blob as soon as enough quoted spans are found
+            quoted = [m.group(1) for m in itertools.islice(_QUOTED.finditer(raw), count)]
             if quoted:
-                text = "\n".join(f"{i+1}. {q}" for i, q in enumerate(quoted[:count]))
+                text = "\n".join(f"{i+1}. {q}" for i, q in enumerate(quoted))
 
     items = parse_numbered_list(text, count)
 
@@ -185,9 +289,31 @@ def generate_content(content_type: str, count: int, history: list[str]) -> list[
     return items
 
 
-def run() -> dict:
-    """Main entry point. Returns the episode data dict."""
-    state = load_state()
+# How many items a single batched API call fetches when the prefetch
+# queue runs dry — 15 items covers 5 episodes at FACTS_PER_VIDEO=3.
+PREFETCH_BATCH = 15
+
+
+def prefetch_content(content_type: str, state: dict, count: int = PREFETCH_BATCH) -> None:
+    """Top up the prefetch queue for a content type with one batched API call.
+
+    Amortizes LLM latency and per-request token overhead across several
+    episodes; run() pops from the queue and only hits the API when empty.
+    """
+    queue = state.setdefault("prefetch", {}).setdefault(content_type, [])
+    queue.extend(generate_content(content_type, count, state.get("history", [])))
+
+
+def run(state: dict | None = None) -> dict:
+    """Main entry point. Returns the episode data dict.
+
+    Backfill loops can pass a pre-loaded ``state`` dict to generate many
+    episodes without rewriting state.json each time; the caller then calls
+    save_state() once at the end.
+    """
+    own_state = state is None
+    if own_state:
+        state = load_state()
     state["episode"] += 1
     episode = state["episode"]
 
@@ -195,13 +321,21 @@ def run() -> dict:
     rotation_index = (episode - 1) % len(CONTENT_ROTATION)
     content_type = CONTENT_ROTATION[rotation_index]
 
-    # Generate multiple items
-    texts = generate_content(content_type, FACTS_PER_VIDEO, state.get("history", []))
-    state.setdefault("history", []).extend(texts)
-
-    # Keep history from growing forever
-    if len(state["history"]) > 200:
-        state["history"] = state["history"][-200:]
+    # Generate multiple items (local fact bank when no API key is set)
+    if MINIMAX_API_KEY:
+        queue = state.setdefault("prefetch", {}).setdefault(content_type, [])
+        if len(queue) < FACTS_PER_VIDEO:
+            prefetch_content(content_type, state)
+        texts = queue[:FACTS_PER_VIDEO]
+        del queue[:FACTS_PER_VIDEO]
+    else:
+        print("[ContentGen] WARNING: MINIMAX_API_KEY is empty! Drawing from local fact bank.")
+        if content_type == "coffee_shop":
+            bank, bank_key = COFFEE_SHOPS, "shops"
+        else:
+            bank, bank_key = FACTS, "facts"
+        texts = [pick_from_bank(bank, state, bank_key) for _ in range(FACTS_PER_VIDEO)]
+    state.setdefault("history", deque(maxlen=HISTORY_LIMIT)).extend(texts)
 
     config = CONTENT_CONFIG[content_type]
 
@@ -214,11 +348,16 @@ def run() -> dict:
         "title_prefix": config["title_prefix"],
     }
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    global _OUTPUT_READY
+    if not _OUTPUT_READY:
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        _OUTPUT_READY = True
     episode_file = OUTPUT_DIR / f"episode_{episode:04d}.json"
-    episode_file.write_text(json.dumps(episode_data, indent=2))
+    # Episode JSON is only machine-read (video_renderer/uploader) — keep it compact
+    episode_file.write_bytes(orjson.dumps(episode_data))
 
-    save_state(state)
+    if own_state:
+        save_state(state)
 
     print(f"[ContentGen] Episode #{episode} ({content_type})")
     for i, t in enumerate(texts):
@@ -8,8 +8,10 @@ import traceback
 from pathlib import Path
 
 import content_generator
-import video_renderer
-import youtube_uploader
+
+# video_renderer (Pillow) and youtube_uploader (google-api-client) are
+# imported lazily in the steps that need them, so --dry-run and
+# --skip-upload don't pay for their heavy transitive imports.
 
 
 def run_pipeline(skip_upload: bool = False, dry_run: bool = False):
@@ -21,7 +23,8 @@ def run_pipeline(skip_upload: bool = False, dry_run: bool = False):
     # ── Step 1: Generate content ─────────────────────────────────────────
     print("\n[1/3] Generating content...")
     try:
-        episode_data = content_generator.run()
+        with content_generator.StateStore() as state:
+            episode_data = content_generator.run(state)
     except Exception as e:
         print(f"FATAL: Content generation failed: {e}")
         traceback.print_exc()
@@ -36,6 +39,7 @@ def run_pipeline(skip_upload: bool = False, dry_run: bool = False):
     # ── Step 2: Render video ─────────────────────────────────────────────
     print("\n[2/3] Rendering video...")
     try:
+        import video_renderer
         video_path = video_renderer.run(episode_data)
     except Exception as e:
         print(f"FATAL: Video rendering failed: {e}")
@@ -49,6 +53,7 @@ def run_pipeline(skip_upload: bool = False, dry_run: bool = False):
     else:
         print("\n[3/3] Uploading to YouTube...")
         try:
+            import youtube_uploader
             video_id = youtube_uploader.run(video_path, episode_data)
             print(f"  YouTube video ID: {video_id}")
         except Exception as e:
@@ -9,21 +9,26 @@ Produces a 1080x1920 vertical short with:
   - 3 scenes that fade in/out with different facts
   - Background music overlay
 """
+import functools
 import json
 import math
+import multiprocessing
 import os
+import queue
 import random
-import shutil
 import subprocess
 import textwrap
+import threading
+from collections import namedtuple
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from config import (
     VIDEO_WIDTH, VIDEO_HEIGHT, FPS, VIDEO_DURATION_SECONDS,
     FADE_DURATION_SECONDS, SCENE_DURATION_SECONDS,
-    BACKGROUND_MUSIC_FILE, OUTPUT_DIR, FACTS_PER_VIDEO
+    BACKGROUND_MUSIC_FILE, OUTPUT_DIR, FACTS_PER_VIDEO, STATIC_RENDER
 )
 
 # ── Colors ───────────────────────────────────────────────────────────────────
@@ -39,20 +44,48 @@ SPARKLE_COLOR_BASE = (255, 215, 0)
 BEAN_COLOR = (101, 67, 33)
 BEAN_COLOR_LIGHT = (139, 90, 43)
 
-FRAMES_DIR = OUTPUT_DIR / "_frames"
-
+# ── Card geometry (frame-invariant) ──────────────────────────────────────────
+CARD_MARGIN = 80
+CARD_W = VIDEO_WIDTH - CARD_MARGIN * 2
+CARD_H = 900
+CARD_X = CARD_MARGIN
+CARD_Y = (VIDEO_HEIGHT - CARD_H) // 2 + 40
+CARD_RADIUS = 40
+SHADOW_DX, SHADOW_DY = 6, 10
+
+# Card content rows (local tile coordinates, top to bottom)
+DOT_R = 8
+DOT_GAP = 30
+DOTS_Y = 60
+DIVIDER_Y = DOTS_Y + 50
+DIVIDER_MARGIN = 100
+HEADER_Y = DIVIDER_Y + 40
+CONTENT_TOP = HEADER_Y + 90
+LINE_HEIGHT = 54
 
 # ── Font helpers ─────────────────────────────────────────────────────────────
-def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-    font_candidates = [
+def _resolve_font_path(bold: bool) -> str | None:
+    candidates = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold
         else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
         "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold
         else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
     ]
-    for fp in font_candidates:
+    for fp in candidates:
         if os.path.exists(fp):
-            return ImageFont.truetype(fp, size)
+            return fp
+    return None
+
+
+# Probe the filesystem once; font loads themselves are memoized below.
+_FONT_PATHS = {False: _resolve_font_path(False), True: _resolve_font_path(True)}
+
+
+@functools.lru_cache(maxsize=16)
+def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    path = _FONT_PATHS[bold]
+    if path:
+        return ImageFont.truetype(path, size)
     return ImageFont.load_default()
 
 
@@ -96,39 +129,99 @@ class CoffeeBean:
 
 
 # ── Sparkle particles ───────────────────────────────────────────────────────
-class Sparkle:
-    def __init__(self):
-        self.x = random.randint(0, VIDEO_WIDTH)
-        self.y = random.randint(0, VIDEO_HEIGHT)
-        self.size = random.uniform(2, 6)
-        self.phase = random.uniform(0, 2 * math.pi)
-        self.speed = random.uniform(1.5, 4.0)
-        self.drift_x = random.uniform(-0.3, 0.3)
-        self.drift_y = random.uniform(-0.8, -0.2)
-        brightness = random.randint(180, 255)
-        self.color = (brightness, int(brightness * 0.85), 0)
-
-    def get_opacity(self, frame: int) -> float:
-        t = frame / FPS
-        return max(0, min(1, 0.5 + 0.5 * math.sin(self.speed * t + self.phase)))
+class SparkleField:
+    """All sparkles as parallel float32 columns (struct-of-arrays).
 
-    def get_pos(self, frame: int) -> tuple[float, float]:
-        t = frame / FPS
-        x = (self.x + self.drift_x * t * 30) % VIDEO_WIDTH
-        y = (self.y + self.drift_y * t * 30) % VIDEO_HEIGHT
-        return x, y
+    Per-frame positions, radii, and opacities come from one vectorized
+    expression over the whole field instead of per-object attribute
+    lookups and math.sin calls in Python.
+    """
 
+    def __init__(self, count: int, rng: np.random.Generator):
+        self.x = rng.uniform(0, VIDEO_WIDTH, count).astype(np.float32)
+        self.y = rng.uniform(0, VIDEO_HEIGHT, count).astype(np.float32)
+        self.size = rng.uniform(2, 6, count).astype(np.float32)
+        self.phase = rng.uniform(0, 2 * math.pi, count).astype(np.float32)
+        self.speed = rng.uniform(1.5, 4.0, count).astype(np.float32)
+        self.drift_x = rng.uniform(-0.3, 0.3, count).astype(np.float32)
+        self.drift_y = rng.uniform(-0.8, -0.2, count).astype(np.float32)
+        brightness = rng.integers(180, 256, count).astype(np.float32)
+        self.color = np.stack(
+            [brightness, brightness * 0.85, np.zeros(count, np.float32)], axis=1
+        )
 
-def draw_sparkle(draw: ImageDraw.Draw, sparkle: Sparkle, frame: int):
-    opacity = sparkle.get_opacity(frame)
-    if opacity < 0.05:
+    def at_frame(self, frame: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized physics: (x, y, radius, opacity) arrays for a frame."""
+        t = frame / FPS
+        opacity = np.clip(0.5 + 0.5 * np.sin(self.speed * t + self.phase), 0.0, 1.0)
+        x = (self.x + self.drift_x * (t * 30.0)) % VIDEO_WIDTH
+        y = (self.y + self.drift_y * (t * 30.0)) % VIDEO_HEIGHT
+        r = self.size * (0.5 + 0.5 * opacity)
+        return x, y, r, opacity
+
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional — the numpy splat below is the fallback
+    _splat_kernel = None
+else:
+    @njit(cache=True)
+    def _splat_kernel(rgb, xs, ys, rs, opacities, colors):  # pragma: no cover
+        h, w = rgb.shape[:2]
+        for i in range(xs.shape[0]):
+            opacity = opacities[i]
+            if opacity < 0.05:
+                continue
+            x, y, r = xs[i], ys[i], rs[i]
+            n = int(r * 2) + 3
+            x0, x1 = max(0, int(x) - n), min(w, int(x) + n + 1)
+            y0, y1 = max(0, int(y) - n), min(h, int(y) + n + 1)
+            for py in range(y0, y1):
+                dy = abs(py - y)
+                for px in range(x0, x1):
+                    dx = abs(px - x)
+                    core = 1.0 - math.sqrt(dx * dx + dy * dy) / r
+                    core = min(max(core, 0.0), 1.0)
+                    arms = (min(max(1.0 - (dx + dy * 4.0) / (2.0 * r), 0.0), 1.0)
+                            + min(max(1.0 - (dy + dx * 4.0) / (2.0 * r), 0.0), 1.0))
+                    mask = min(core + arms * 0.5, 1.0) * opacity
+                    if mask <= 0.0:
+                        continue
+                    for c in range(3):
+                        v = rgb[py, px, c] + np.int16(mask * colors[i, c])
+                        rgb[py, px, c] = 255 if v > 255 else v
+
+
+def _splat_sparkles(arr: np.ndarray, sparkles: SparkleField, frame: int) -> None:
+    """Blend sparkles additively into a uint8 frame array.
+
+    Each sparkle only touches a ~(4r)^2 window, so writing those small
+    slices directly is far cheaper than allocating a full-screen RGBA
+    layer and alpha-compositing 8 MB per frame. With numba installed the
+    inner loops run as a compiled kernel; otherwise numpy slices do.
+    """
+    h, w = arr.shape[:2]
+    xs, ys, rs, opacities = sparkles.at_frame(frame)
+    if _splat_kernel is not None:
+        _splat_kernel(arr[:, :, :3], xs, ys, rs, opacities, sparkles.color)
         return
-    x, y = sparkle.get_pos(frame)
-    r = sparkle.size * (0.5 + 0.5 * opacity)
-    color = tuple(int(c * opacity) for c in sparkle.color) + (int(255 * opacity),)
-    draw.line([(x, y - r * 2), (x, y + r * 2)], fill=color, width=max(1, int(r * 0.5)))
-    draw.line([(x - r * 2, y), (x + r * 2, y)], fill=color, width=max(1, int(r * 0.5)))
-    draw.ellipse([x - r, y - r, x + r, y + r], fill=color)
+    for i in np.nonzero(opacities >= 0.05)[0]:
+        x, y, r, opacity = xs[i], ys[i], rs[i], opacities[i]
+        n = int(r * 2) + 3
+        x0, x1 = max(0, int(x) - n), min(w, int(x) + n + 1)
+        y0, y1 = max(0, int(y) - n), min(h, int(y) + n + 1)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        dy = np.abs(np.arange(y0, y1, dtype=np.float32) - y)[:, None]
+        dx = np.abs(np.arange(x0, x1, dtype=np.float32) - x)[None, :]
+        # Bright core plus a 4-point star of cross arms, fading with distance
+        core = np.clip(1.0 - np.sqrt(dx * dx + dy * dy) / r, 0.0, 1.0)
+        arms = (np.clip(1.0 - (dx + dy * 4.0) / (2.0 * r), 0.0, 1.0)
+                + np.clip(1.0 - (dy + dx * 4.0) / (2.0 * r), 0.0, 1.0))
+        mask = np.clip(core + arms * 0.5, 0.0, 1.0) * opacity
+        add = (mask[..., None] * sparkles.color[i]).astype(np.int16)
+        region = arr[y0:y1, x0:x1, :3]
+        region[:] = np.clip(region.astype(np.int16) + add, 0, 255).astype(np.uint8)
 
 
 # ── Rounded rectangle helper ────────────────────────────────────────────────
@@ -137,25 +230,56 @@ def draw_rounded_rect(draw, bbox, radius, fill, outline=None):
 
 
 # ── Text wrapping helper ────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=4096)
+def _word_width(font: ImageFont.FreeTypeFont, word: str) -> float:
+    # Fonts are process-wide singletons via get_font, so they are stable
+    # cache keys; many words repeat across facts.
+    return font.getlength(word)
+
+
 def wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list[str]:
-    words = text.split()
-    lines = []
-    current_line = ""
-    for word in words:
-        test = f"{current_line} {word}".strip()
-        bbox = font.getbbox(test)
-        w = bbox[2] - bbox[0]
-        if w <= max_width:
-            current_line = test
+    """Greedy word wrap using a running width sum.
+
+    font.getlength is a plain advance-width query (much cheaper than the
+    full getbbox layout call), and accumulating widths avoids re-measuring
+    the whole candidate line for every word.
+    """
+    space_w = _word_width(font, " ")
+    lines: list[str] = []
+    current: list[str] = []
+    running = 0.0
+    for word in text.split():
+        w = _word_width(font, word)
+        nxt = running + (space_w if current else 0.0) + w
+        if nxt <= max_width or not current:
+            current.append(word)
+            running = nxt
         else:
-            if current_line:
-                lines.append(current_line)
-            current_line = word
-    if current_line:
-        lines.append(current_line)
+            lines.append(" ".join(current))
+            current = [word]
+            running = w
+    if current:
+        lines.append(" ".join(current))
     return lines
 
 
+# ── Background builder ───────────────────────────────────────────────────────
+def build_background(beans: list[CoffeeBean]) -> Image.Image:
+    """Pre-composite the tan backdrop and all rotated bean sprites.
+
+    The 35 bicubic bean rotations happen exactly once here, at init,
+    instead of as a latency spike on the first rendered frame.
+    """
+    bg = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), BG_COLOR + (255,))
+    draw = ImageDraw.Draw(bg)
+    for bean in beans:
+        bean.draw(draw, bg)
+    # The masked bean pastes dent the alpha channel slightly; the backdrop is
+    # conceptually opaque, so flatten it — downstream restores rely on it.
+    bg.putalpha(255)
+    return bg
+
+
 # ── Scene timing ─────────────────────────────────────────────────────────────
 def get_scene_info(frame_num: int) -> tuple[int, float, float]:
     """
@@ -182,38 +306,14 @@ def get_scene_info(frame_num: int) -> tuple[int, float, float]:
         return scene_idx, ease, ease
 
 
-# ── Frame renderer ───────────────────────────────────────────────────────────
-def render_frame(
-    frame_num: int,
-    total_frames: int,
-    episode_data: dict,
-    sparkles: list[Sparkle],
-    beans: list[CoffeeBean],
-    bg_cache: Image.Image | None = None,
-) -> tuple[Image.Image, Image.Image]:
-    """Render a single frame. Returns (frame_image, bg_cache)."""
-
-    scene_idx, card_opacity, text_opacity = get_scene_info(frame_num)
-    texts = episode_data.get("texts", [episode_data.get("text", "")])
-    current_text = texts[scene_idx] if scene_idx < len(texts) else texts[-1]
-    header = episode_data.get("header", "DID YOU KNOW?")
-
-    # ── Static background (cached) ───────────────────────────────────────
-    if bg_cache is None:
-        bg_cache = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), BG_COLOR + (255,))
-        for bean in beans:
-            bean.draw(ImageDraw.Draw(bg_cache), bg_cache)
-
-    img = bg_cache.copy()
-
-    # ── Sparkles ─────────────────────────────────────────────────────────
-    sparkle_layer = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), (0, 0, 0, 0))
-    sparkle_draw = ImageDraw.Draw(sparkle_layer)
-    for s in sparkles:
-        draw_sparkle(sparkle_draw, s, frame_num)
-    img = Image.alpha_composite(img, sparkle_layer)
-
-    # ── "caffeine chronicles" pill banner (always visible) ───────────────
+# ── Static text tiles ────────────────────────────────────────────────────────
+# The pill banner and watermark never change — not per frame, not per
+# episode — so rasterize each once into a small RGBA tile and composite
+# that, instead of re-shaping glyphs through FreeType on every overlay
+# build.
+@functools.lru_cache(maxsize=1)
+def _pill_tile() -> tuple[Image.Image, tuple[int, int]]:
+    """Pre-rendered "caffeine chronicles" pill and its paste position."""
     pill_font = get_font(36, bold=True)
     pill_text = "caffeine chronicles"
     pill_bbox = pill_font.getbbox(pill_text)
@@ -222,113 +322,322 @@ def render_frame(
     pill_pad_x, pill_pad_y = 50, 18
     pill_w = pill_tw + pill_pad_x * 2
     pill_h = pill_th + pill_pad_y * 2
-    pill_x = (VIDEO_WIDTH - pill_w) // 2
-    pill_y = 140
 
-    pill_layer = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), (0, 0, 0, 0))
-    pill_draw = ImageDraw.Draw(pill_layer)
-    draw_rounded_rect(pill_draw, [pill_x, pill_y, pill_x + pill_w, pill_y + pill_h],
+    tile = Image.new("RGBA", (pill_w, pill_h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    draw_rounded_rect(draw, [0, 0, pill_w - 1, pill_h - 1],
                        radius=pill_h // 2, fill=PILL_BG + (255,))
-    pill_draw.text(
-        (pill_x + pill_pad_x, pill_y + pill_pad_y - 2),
-        pill_text, font=pill_font, fill=PILL_TEXT + (255,)
-    )
-    img = Image.alpha_composite(img, pill_layer)
-
-    # ── White card (fades with scene) ────────────────────────────────────
-    card_margin = 80
-    card_w = VIDEO_WIDTH - card_margin * 2
-    card_h = 900
-    card_x = card_margin
-    card_y = (VIDEO_HEIGHT - card_h) // 2 + 40
-    card_radius = 40
+    draw.text((pill_pad_x, pill_pad_y - 2), pill_text,
+              font=pill_font, fill=PILL_TEXT + (255,))
+    return tile, ((VIDEO_WIDTH - pill_w) // 2, 140)
+
+
+@functools.lru_cache(maxsize=1)
+def _watermark_tile() -> tuple[Image.Image, tuple[int, int]]:
+    """Pre-rendered @CaffeineChronicles watermark and its paste position."""
+    wm_font = get_font(24, bold=False)
+    wm_text = "@CaffeineChronicles"
+    wm_bbox = wm_font.getbbox(wm_text)
+    wm_tw = wm_bbox[2] - wm_bbox[0]
+    wm_th = wm_bbox[3]
+
+    tile = Image.new("RGBA", (wm_tw + 2, wm_th + 10), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    draw.text((0, 0), wm_text, font=wm_font, fill=EPISODE_COLOR + (180,))
+    return tile, ((VIDEO_WIDTH - wm_tw) // 2, VIDEO_HEIGHT - 100)
+
+
+# ── Per-scene layout ─────────────────────────────────────────────────────────
+# Everything measured here (header centering, wrapped fact lines, per-line
+# x offsets, vertical centering) depends only on the scene, not the frame,
+# so it is computed once per scene and reused by every card tile build —
+# fade frames included.
+FrameLayout = namedtuple("FrameLayout", "header header_x lines line_xs text_start_y")
+
+_layout_cache: dict[int, FrameLayout] = {}
+_layout_cache_for: dict | None = None
+
+
+def _scene_layout(episode_data: dict, scene_idx: int) -> FrameLayout:
+    global _layout_cache_for
+    if _layout_cache_for is not episode_data:
+        _layout_cache.clear()
+        _layout_cache_for = episode_data
+    layout = _layout_cache.get(scene_idx)
+    if layout is not None:
+        return layout
+
+    texts = episode_data.get("texts", [episode_data.get("text", "")])
+    current_text = texts[scene_idx] if scene_idx < len(texts) else texts[-1]
+    header = episode_data.get("header", "DID YOU KNOW?")
+
+    header_font = get_font(44, bold=True)
+    header_bbox = header_font.getbbox(header)
+    header_x = (CARD_W - (header_bbox[2] - header_bbox[0])) // 2
+
+    fact_font = get_font(38, bold=False)
+    lines = wrap_text(current_text, fact_font, CARD_W - 120)
+    line_xs = []
+    for line in lines:
+        line_bbox = fact_font.getbbox(line)
+        line_xs.append((CARD_W - (line_bbox[2] - line_bbox[0])) // 2)
+
+    total_text_h = len(lines) * LINE_HEIGHT
+    remaining_h = CARD_H - CONTENT_TOP - 80
+    text_start_y = CONTENT_TOP + max(0, (remaining_h - total_text_h) // 2)
+
+    layout = FrameLayout(header, header_x, lines, line_xs, text_start_y)
+    _layout_cache[scene_idx] = layout
+    return layout
+
+
+# ── Card tile builder ────────────────────────────────────────────────────────
+def build_card_tile(
+    episode_data: dict,
+    scene_idx: int,
+    card_opacity: float = 1.0,
+    text_opacity: float = 1.0,
+) -> Image.Image:
+    """Fuse shadow, card body, dots, divider, header, and fact text into
+    one tile covering just the card region (plus the shadow margin).
+
+    Working at tile size instead of full canvas cuts each internal
+    composite from ~2 Mpx to ~0.8 Mpx, and the result is cacheable per
+    scene.
+    """
+    layout = _scene_layout(episode_data, scene_idx)
+
+    tile_w = CARD_W + SHADOW_DX
+    tile_h = CARD_H + SHADOW_DY
     c_alpha = int(255 * card_opacity)
 
-    # Shadow
-    shadow_layer = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), (0, 0, 0, 0))
-    shadow_draw = ImageDraw.Draw(shadow_layer)
+    # Shadow (drawn first, straight onto the transparent tile)
+    tile = Image.new("RGBA", (tile_w, tile_h), (0, 0, 0, 0))
+    shadow_draw = ImageDraw.Draw(tile)
     draw_rounded_rect(shadow_draw,
-                       [card_x + 6, card_y + 10, card_x + card_w + 6, card_y + card_h + 10],
-                       radius=card_radius, fill=CARD_SHADOW[:3] + (int(CARD_SHADOW[3] * card_opacity),))
-    img = Image.alpha_composite(img, shadow_layer)
+                       [SHADOW_DX, SHADOW_DY, CARD_W + SHADOW_DX, CARD_H + SHADOW_DY],
+                       radius=CARD_RADIUS, fill=CARD_SHADOW[:3] + (int(CARD_SHADOW[3] * card_opacity),))
 
     # Card background
-    card_layer = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), (0, 0, 0, 0))
+    card_layer = Image.new("RGBA", (tile_w, tile_h), (0, 0, 0, 0))
     card_draw = ImageDraw.Draw(card_layer)
-    draw_rounded_rect(card_draw,
-                       [card_x, card_y, card_x + card_w, card_y + card_h],
-                       radius=card_radius, fill=CARD_BG + (c_alpha,))
-    img = Image.alpha_composite(img, card_layer)
+    draw_rounded_rect(card_draw, [0, 0, CARD_W, CARD_H],
+                       radius=CARD_RADIUS, fill=CARD_BG + (c_alpha,))
+    tile = Image.alpha_composite(tile, card_layer)
 
     # ── Card content ─────────────────────────────────────────────────────
     t_alpha = int(255 * text_opacity)
-    text_layer = Image.new("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), (0, 0, 0, 0))
+    text_layer = Image.new("RGBA", (tile_w, tile_h), (0, 0, 0, 0))
     text_draw = ImageDraw.Draw(text_layer)
 
-    inner_w = card_w - 120
-    current_y = card_y + 60
-
     # Scene counter dots
-    dot_r = 8
-    dot_gap = 30
-    total_dot_w = FACTS_PER_VIDEO * dot_r * 2 + (FACTS_PER_VIDEO - 1) * dot_gap
-    dot_start_x = card_x + (card_w - total_dot_w) // 2
+    total_dot_w = FACTS_PER_VIDEO * DOT_R * 2 + (FACTS_PER_VIDEO - 1) * DOT_GAP
+    dot_start_x = (CARD_W - total_dot_w) // 2
     for i in range(FACTS_PER_VIDEO):
-        dx = dot_start_x + i * (dot_r * 2 + dot_gap)
+        dx = dot_start_x + i * (DOT_R * 2 + DOT_GAP)
         if i == scene_idx:
             dot_color = HEADER_COLOR + (t_alpha,)
         else:
             dot_color = EPISODE_COLOR + (t_alpha // 2,)
-        text_draw.ellipse([dx, current_y, dx + dot_r * 2, current_y + dot_r * 2], fill=dot_color)
-    current_y += 50
+        text_draw.ellipse([dx, DOTS_Y, dx + DOT_R * 2, DOTS_Y + DOT_R * 2], fill=dot_color)
 
     # Thin divider
-    div_margin = 100
     text_draw.line(
-        [(card_x + div_margin, current_y), (card_x + card_w - div_margin, current_y)],
+        [(DIVIDER_MARGIN, DIVIDER_Y), (CARD_W - DIVIDER_MARGIN, DIVIDER_Y)],
         fill=EPISODE_COLOR + (t_alpha // 2,), width=2
     )
-    current_y += 40
 
     # Header
-    header_font = get_font(44, bold=True)
-    header_bbox = header_font.getbbox(header)
-    header_tw = header_bbox[2] - header_bbox[0]
-    text_draw.text(
-        (card_x + (card_w - header_tw) // 2, current_y),
-        header, font=header_font, fill=HEADER_COLOR + (t_alpha,)
-    )
-    current_y += 90
+    text_draw.text((layout.header_x, HEADER_Y), layout.header,
+                   font=get_font(44, bold=True), fill=HEADER_COLOR + (t_alpha,))
 
-    # Fact text (wrapped)
+    # Fact text (pre-wrapped and pre-centered by _scene_layout)
     fact_font = get_font(38, bold=False)
-    lines = wrap_text(current_text, fact_font, inner_w)
-    line_height = 54
-    total_text_h = len(lines) * line_height
-    remaining_h = card_h - (current_y - card_y) - 80
-    text_start_y = current_y + max(0, (remaining_h - total_text_h) // 2)
+    for i, line in enumerate(layout.lines):
+        ly = layout.text_start_y + i * LINE_HEIGHT
+        text_draw.text((layout.line_xs[i], ly), line,
+                       font=fact_font, fill=FACT_COLOR + (t_alpha,))
 
-    for i, line in enumerate(lines):
-        line_bbox = fact_font.getbbox(line)
-        line_tw = line_bbox[2] - line_bbox[0]
-        lx = card_x + (card_w - line_tw) // 2
-        ly = text_start_y + i * line_height
-        text_draw.text((lx, ly), line, font=fact_font, fill=FACT_COLOR + (t_alpha,))
+    return Image.alpha_composite(tile, text_layer)
 
-    img = Image.alpha_composite(img, text_layer)
 
-    # ── Bottom watermark ─────────────────────────────────────────────────
-    wm_font = get_font(24, bold=False)
-    wm_text = "@CaffeineChronicles"
-    wm_bbox = wm_font.getbbox(wm_text)
-    wm_tw = wm_bbox[2] - wm_bbox[0]
-    final_draw = ImageDraw.Draw(img)
-    final_draw.text(
-        ((VIDEO_WIDTH - wm_tw) // 2, VIDEO_HEIGHT - 100),
-        wm_text, font=wm_font, fill=EPISODE_COLOR + (180,)
+# Full-opacity card tiles per scene — rebuilt only when episode_data changes.
+_card_cache: dict[int, Image.Image] = {}
+_card_cache_for: dict | None = None
+
+
+def _get_card_tile(episode_data: dict, scene_idx: int,
+                   card_opacity: float, text_opacity: float) -> Image.Image:
+    global _card_cache_for
+    if _card_cache_for is not episode_data:
+        _card_cache.clear()
+        _card_cache_for = episode_data
+    tile = _card_cache.get(scene_idx)
+    if tile is None:
+        tile = _card_cache[scene_idx] = build_card_tile(episode_data, scene_idx)
+    if card_opacity == 1.0 and text_opacity == 1.0:
+        return tile
+    # Equal-opacity fades are handled by the blend path in render_frame;
+    # anything else is a bespoke tile, drawn fresh.
+    return build_card_tile(episode_data, scene_idx, card_opacity, text_opacity)
+
+
+# ── Frame renderer ───────────────────────────────────────────────────────────
+def render_frame(
+    frame_num: int,
+    total_frames: int,
+    episode_data: dict,
+    sparkles: SparkleField,
+    beans: list[CoffeeBean],
+    bg_cache: Image.Image | None = None,
+    work: np.ndarray | None = None,
+    bg_rgb: np.ndarray | None = None,
+) -> tuple[Image.Image, Image.Image]:
+    """Render a single frame. Returns (RGBA frame_image, bg_cache).
+
+    `work` is an optional preallocated (H, W, 4) uint8 scratch buffer; when
+    given, the frame is rendered in place into it (no per-frame allocation).
+    `bg_rgb` is an optional (H, W, 3) snapshot of the background: the bg is
+    fully opaque, so copying just RGB (alpha is 255 once and stays 255 under
+    opaque compositing) cuts the per-frame copy bandwidth by a quarter.
+    """
+
+    scene_idx, card_opacity, text_opacity = get_scene_info(frame_num)
+
+    # ── Static background (normally pre-built by the worker initializer) ─
+    if bg_cache is None:
+        bg_cache = build_background(beans)
+
+    # ── Sparkles (blended directly into a working copy of the bg) ────────
+    if work is None:
+        arr = np.array(bg_cache)
+    elif bg_rgb is not None:
+        np.copyto(work[..., :3], bg_rgb)
+        arr = work
+    else:
+        np.copyto(work, np.asarray(bg_cache))
+        arr = work
+    _splat_sparkles(arr, sparkles, frame_num)
+    # frombuffer shares memory with `arr`; clearing readonly lets the
+    # composites below write straight into it instead of copy-on-write.
+    img = Image.frombuffer("RGBA", (VIDEO_WIDTH, VIDEO_HEIGHT), arr, "raw", "RGBA", 0, 1)
+    img.readonly = 0
+
+    # ── Pill banner, card, watermark — in-place composites over just the
+    #    pixels each tile covers, not the whole canvas ──────────────────────
+    pill, pill_pos = _pill_tile()
+    img.alpha_composite(pill, pill_pos)
+    if card_opacity == text_opacity and card_opacity < 1.0:
+        # Fade via a straight lerp: blending the region against its fully
+        # composited version equals compositing the tile at scaled alpha
+        # ((1-o)*bg + o*(bg over tile)), but as a SIMD-friendly Image.blend.
+        tile = _get_card_tile(episode_data, scene_idx, 1.0, 1.0)
+        box = (CARD_X, CARD_Y, CARD_X + tile.width, CARD_Y + tile.height)
+        crop = img.crop(box)
+        full = Image.alpha_composite(crop, tile)
+        img.paste(Image.blend(crop, full, card_opacity), box)
+    else:
+        img.alpha_composite(
+            _get_card_tile(episode_data, scene_idx, card_opacity, text_opacity),
+            (CARD_X, CARD_Y),
+        )
+    wm, wm_pos = _watermark_tile()
+    img.alpha_composite(wm, wm_pos)
+
+    return img, bg_cache
+
+
+# ── Parallel rendering workers ──────────────────────────────────────────────
+# Frames are independent given the episode seed, so a process pool renders
+# them in parallel; each worker rebuilds the deterministic sparkles/beans
+# from the seed in its initializer and keeps its own background cache.
+_worker: dict = {}
+
+
+def _init_worker(episode_data: dict, episode: int, total_frames: int) -> None:
+    random.seed(episode)
+    _worker["episode_data"] = episode_data
+    _worker["total_frames"] = total_frames
+    _worker["sparkles"] = SparkleField(60, np.random.default_rng(episode))
+    _worker["beans"] = [CoffeeBean() for _ in range(35)]
+    _worker["bg_cache"] = build_background(_worker["beans"])
+    # Contiguous RGB snapshot of the (opaque) background for cheap restores.
+    _worker["bg_rgb"] = np.ascontiguousarray(np.asarray(_worker["bg_cache"])[..., :3])
+    # One scratch frame buffer per worker, reused for every frame it renders.
+    # Alpha is set once here and never changes: the bg is opaque and every
+    # per-frame write (sparkle splat, RGB restore) touches only RGB.
+    _worker["work"] = np.empty((VIDEO_HEIGHT, VIDEO_WIDTH, 4), dtype=np.uint8)
+    _worker["work"][..., 3] = 255
+
+
+def _render_one(frame_num: int) -> bytes:
+    img, _worker["bg_cache"] = render_frame(
+        frame_num,
+        _worker["total_frames"],
+        _worker["episode_data"],
+        _worker["sparkles"],
+        _worker["beans"],
+        _worker["bg_cache"],
+        _worker["work"],
+        _worker["bg_rgb"],
     )
+    # Drop the alpha channel via a numpy slice instead of img.convert("RGB"),
+    # which would materialize a second full-frame image just to discard it.
+    return np.asarray(img)[:, :, :3].tobytes()
 
-    return img.convert("RGB"), bg_cache
+
+# ── FFmpeg encoder selection ────────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
+def _video_codec_opts() -> tuple[str, ...]:
+    """Pick the video encoder once per process.
+
+    Prefer NVENC when the local FFmpeg build has it (encoding becomes
+    near-free on the GPU); otherwise use libx264 with veryfast, which is
+    ~2x quicker than the old medium preset at negligible quality cost for
+    this mostly-static content, and let x264 use every core.
+
+    The content is near-still (card + sparkles, brief fades), so tune
+    libx264 for still images and pin one GOP per scene: keyframes land
+    exactly on the scene cuts and the encoder wastes no motion search or
+    extra keyframes mid-scene.
+    """
+    # A build that lists h264_nvenc isn't enough — distro FFmpeg is compiled
+    # with nvenc even on GPU-less machines, where the encoder fails at init.
+    # Probe usability with a one-frame test encode instead.
+    try:
+        nvenc_ok = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-v", "error",
+             "-f", "lavfi", "-i", "color=black:s=64x64",
+             "-frames:v", "1", "-c:v", "h264_nvenc", "-f", "null", "-"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        ).returncode == 0
+    except OSError:
+        nvenc_ok = False
+    gop = str(int(FPS * SCENE_DURATION_SECONDS))
+    if nvenc_ok:
+        return ("-c:v", "h264_nvenc", "-preset", "p4",
+                "-rc", "vbr", "-cq", "20", "-b:v", "6M", "-g", gop)
+    return ("-c:v", "libx264", "-preset", "veryfast", "-crf", "20",
+            "-threads", "0", "-tune", "stillimage",
+            "-g", gop, "-keyint_min", gop,
+            "-x264-params", "aq-mode=3:rc-lookahead=20")
+
+
+def _drain_frames(frame_q: "queue.Queue[bytes | None]", stdin,
+                  errors: list[Exception]) -> None:
+    """Writer-thread loop: feed queued frames to FFmpeg until sentinel.
+
+    If FFmpeg dies early the write fails; record the error but keep
+    consuming until the sentinel so the producer never blocks forever on
+    a full queue.
+    """
+    while (buf := frame_q.get()) is not None:
+        if errors:
+            continue
+        try:
+            stdin.write(buf)
+        except OSError as e:  # BrokenPipeError included
+            errors.append(e)
 
 
 # ── Main render pipeline ────────────────────────────────────────────────────
@@ -336,30 +645,23 @@ def render_video(episode_data: dict) -> Path:
     episode = episode_data["episode"]
     total_frames = FPS * VIDEO_DURATION_SECONDS
 
-    if FRAMES_DIR.exists():
-        shutil.rmtree(FRAMES_DIR)
-    FRAMES_DIR.mkdir(parents=True)
-
-    random.seed(episode)
-    sparkles = [Sparkle() for _ in range(60)]
-    beans = [CoffeeBean() for _ in range(35)]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     print(f"[VideoRenderer] Rendering {total_frames} frames at {FPS}fps...")
     print(f"[VideoRenderer] {FACTS_PER_VIDEO} scenes, {SCENE_DURATION_SECONDS}s each")
 
-    bg_cache = None
-    for f in range(total_frames):
-        img, bg_cache = render_frame(f, total_frames, episode_data, sparkles, beans, bg_cache)
-        img.save(FRAMES_DIR / f"frame_{f:05d}.png")
-        if f % (FPS * 5) == 0:
-            print(f"  ... frame {f}/{total_frames}")
-
     output_file = OUTPUT_DIR / f"episode_{episode:04d}.mp4"
 
+    # Frames are piped straight into FFmpeg as raw RGB — no per-frame PNG
+    # encode/decode cycle and no temp directory on disk.
     ffmpeg_cmd = [
         "ffmpeg", "-y",
+        "-v", "error",  # errors only, so the captured stderr stays small
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{VIDEO_WIDTH}x{VIDEO_HEIGHT}",
         "-framerate", str(FPS),
-        "-i", str(FRAMES_DIR / "frame_%05d.png"),
+        "-i", "-",
     ]
 
     if BACKGROUND_MUSIC_FILE.exists():
@@ -374,24 +676,163 @@ def render_video(episode_data: dict) -> Path:
         print("[VideoRenderer] No background_music.mp3 found — using silence.")
 
     ffmpeg_cmd += [
-        "-c:v", "libx264",
+        *_video_codec_opts(),
         "-pix_fmt", "yuv420p",
-        "-preset", "medium",
-        "-crf", "20",
         *audio_opts,
         "-movflags", "+faststart",
         str(output_file),
     ]
 
-    print("[VideoRenderer] Running FFmpeg...")
-    subprocess.run(ffmpeg_cmd, check=True, capture_output=True)
+    print("[VideoRenderer] Streaming frames to FFmpeg...")
+    proc = subprocess.Popen(
+        ffmpeg_cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=1024 * 1024,  # big pipe buffer — each frame is ~6 MB
+    )
+    # A bounded queue + dedicated writer thread decouples frame collection
+    # from the stdin pipe: when FFmpeg stalls the writer blocks, but the
+    # main thread keeps draining pool results. maxsize bounds memory at
+    # ~8 frames (~48 MB) if the encoder falls behind.
+    frame_q: queue.Queue = queue.Queue(maxsize=8)
+    write_errors: list[Exception] = []
+    writer = threading.Thread(target=_drain_frames, args=(frame_q, proc.stdin, write_errors))
+    writer.start()
+    workers = os.cpu_count() or 1
+    try:
+        with multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(episode_data, episode, total_frames)
+        ) as pool:
+            # imap preserves order, so FFmpeg receives frames monotonically
+            for f, rgb in enumerate(pool.imap(_render_one, range(total_frames), chunksize=8)):
+                if write_errors:
+                    break  # FFmpeg died — stop rendering frames it won't read
+                frame_q.put(rgb)
+                if f % (FPS * 5) == 0:
+                    print(f"  ... frame {f}/{total_frames}")
+    finally:
+        # Always unblock and reap the writer thread, even when a pool
+        # worker raised — otherwise it waits on the queue forever.
+        frame_q.put(None)
+        writer.join()
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.stderr.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        if stderr:
+            print(f"[VideoRenderer] FFmpeg failed:\n{stderr}")
+        raise subprocess.CalledProcessError(returncode, ffmpeg_cmd, stderr=stderr)
+    if write_errors:
+        raise RuntimeError("FFmpeg stopped reading frames") from write_errors[0]
+
+    print(f"[VideoRenderer] Output: {output_file}")
+    return output_file
+
+
+# ── Static render path (CC_STATIC_RENDER=1) ─────────────────────────────────
+def render_video_static(episode_data: dict) -> Path:
+    """Render via an FFmpeg filter graph instead of per-frame Python.
+
+    Everything except the sparkles is static within a scene, so we bake one
+    background PNG (beans + pill + watermark) and one card PNG per scene,
+    then let FFmpeg fade each card in/out and overlay it at the right time.
+    Frame generation drops from `total_frames` renders to 1 + FACTS_PER_VIDEO
+    images; the trade-off is no sparkles and linear rather than eased fades.
+    """
+    episode = episode_data["episode"]
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    output_file = OUTPUT_DIR / f"episode_{episode:04d}.mp4"
+
+    print(f"[VideoRenderer] Static render: {1 + FACTS_PER_VIDEO} images + FFmpeg filters")
+
+    # Bake the static layers. Seeding matches the per-frame path so the bean
+    # scatter is identical for a given episode number.
+    random.seed(episode)
+    bg = build_background([CoffeeBean() for _ in range(35)])
+    pill, pill_pos = _pill_tile()
+    bg.alpha_composite(pill, pill_pos)
+    wm, wm_pos = _watermark_tile()
+    bg.alpha_composite(wm, wm_pos)
+
+    bg_file = OUTPUT_DIR / f"episode_{episode:04d}_bg.png"
+    bg.convert("RGB").save(bg_file)
+    card_files = []
+    for i in range(FACTS_PER_VIDEO):
+        card_file = OUTPUT_DIR / f"episode_{episode:04d}_card{i}.png"
+        build_card_tile(episode_data, i).save(card_file)
+        card_files.append(card_file)
+
+    scene = SCENE_DURATION_SECONDS
+    fade = FADE_DURATION_SECONDS
+    ffmpeg_cmd = [
+        "ffmpeg", "-y",
+        "-v", "error",  # errors only, so the captured stderr stays small
+        "-loop", "1", "-framerate", str(FPS),
+        "-t", str(VIDEO_DURATION_SECONDS), "-i", str(bg_file),
+    ]
+    for card_file in card_files:
+        ffmpeg_cmd += ["-loop", "1", "-framerate", str(FPS),
+                       "-t", str(scene), "-i", str(card_file)]
+
+    if BACKGROUND_MUSIC_FILE.exists():
+        ffmpeg_cmd += ["-i", str(BACKGROUND_MUSIC_FILE), "-shortest"]
+    else:
+        ffmpeg_cmd += [
+            "-f", "lavfi", "-i",
+            f"anullsrc=r=44100:cl=stereo:d={VIDEO_DURATION_SECONDS}",
+        ]
+        print("[VideoRenderer] No background_music.mp3 found — using silence.")
+    audio_idx = 1 + FACTS_PER_VIDEO
+
+    # Each card: fade in/out (alpha=1 keeps the rounded corners transparent),
+    # shift its timeline to the scene start, overlay onto the running chain.
+    filters = []
+    last = "0:v"
+    for i in range(FACTS_PER_VIDEO):
+        filters.append(
+            f"[{i + 1}:v]format=rgba,"
+            f"fade=t=in:st=0:d={fade}:alpha=1,"
+            f"fade=t=out:st={scene - fade}:d={fade}:alpha=1,"
+            f"setpts=PTS-STARTPTS+{i * scene}/TB[c{i}]"
+        )
+        out = f"v{i}"
+        filters.append(
+            f"[{last}][c{i}]overlay=x={CARD_X}:y={CARD_Y}:eof_action=pass[{out}]"
+        )
+        last = out
+
+    ffmpeg_cmd += [
+        "-filter_complex", ";".join(filters),
+        "-map", f"[{last}]", "-map", f"{audio_idx}:a",
+        *_video_codec_opts(),
+        "-pix_fmt", "yuv420p",
+        "-r", str(FPS),
+        "-c:a", "aac", "-b:a", "128k",
+        "-movflags", "+faststart",
+        str(output_file),
+    ]
+
+    result = subprocess.run(ffmpeg_cmd, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    for f in (bg_file, *card_files):
+        f.unlink(missing_ok=True)
+    if result.returncode != 0:
+        print(f"[VideoRenderer] FFmpeg failed:\n{result.stderr}")
+        raise subprocess.CalledProcessError(result.returncode, ffmpeg_cmd,
+                                            stderr=result.stderr)
 
-    shutil.rmtree(FRAMES_DIR)
     print(f"[VideoRenderer] Output: {output_file}")
     return output_file
 
 
 def run(episode_data: dict) -> Path:
+    if STATIC_RENDER:
+        return render_video_static(episode_data)
     return render_video(episode_data)
 
 
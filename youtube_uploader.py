@@ -5,15 +5,29 @@ Uploads rendered video as a YouTube Short using YouTube Data API v3.
 Authentication uses OAuth 2.0 with a refresh token for headless/CI environments.
 See README for how to obtain credentials.
 """
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import hashlib
 import json
+import mmap
 import os
-import time
+import random
+import socket
+import ssl
+import threading
+from datetime import datetime
 from pathlib import Path
 
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+try:
+    import fcntl
+except ImportError:  # non-POSIX: skip cross-process locking
+    fcntl = None
+
+# The google-auth/googleapiclient stack (~40 modules) is imported lazily in
+# the functions that touch it, so constructing this module — e.g. from a
+# dry-run pipeline that never uploads — doesn't pay the import cost.
 
 from config import (
     YOUTUBE_TAGS, YOUTUBE_CATEGORY_ID, YOUTUBE_PRIVACY,
@@ -22,6 +36,10 @@ from config import (
 
 TOKEN_FILE = PROJECT_ROOT / "youtube_token.json"
 
+# sha256 -> video_id map of what's already on the channel, so pipeline
+# re-runs over the same rendered file don't publish duplicate Shorts.
+UPLOAD_CACHE_FILE = PROJECT_ROOT / "uploaded_videos.json"
+
 # These can come from env vars (for CI) or a local client_secrets.json
 CLIENT_ID = os.environ.get("YOUTUBE_CLIENT_ID", "")
 CLIENT_SECRET = os.environ.get("YOUTUBE_CLIENT_SECRET", "")
@@ -34,40 +52,297 @@ TOKEN_URI = "https://oauth2.googleapis.com/token"
 MAX_RETRIES = 5
 RETRY_BACKOFF = 2  # exponential backoff base (seconds)
 
+# Below this size a single-shot upload is used: the resumable protocol costs
+# an extra round-trip per chunk plus session setup, which dwarfs the benefit
+# for a typical sub-30 MB Short.
+RESUMABLE_THRESHOLD = 25 * 1024 * 1024
+
+# On the resumable path, files below this stream the whole body in a single
+# request (chunksize=-1) — one POST on the resumable session instead of a
+# round-trip per 8 MB chunk. Chunking is kept only where buffering the file
+# would hurt memory.
+MAX_STREAM_SIZE = 256 * 1024 * 1024
+
+_CHUNK_GRANULE = 256 * 1024  # the upload protocol requires 256 KB multiples
+
+
+def _upload_chunk_size() -> int:
+    """Resumable chunk size in bytes, from YT_UPLOAD_CHUNK_SIZE.
+
+    Defaults to -1 (stream the whole body in one request — fastest when
+    memory allows). Explicit values are rounded down to a 256 KB multiple
+    and clamped to [256 KB, 100 MB]; on high-RTT links a chunk sized near
+    the bandwidth-delay product keeps the pipe full.
+    """
+    raw = os.environ.get("YT_UPLOAD_CHUNK_SIZE", "")
+    try:
+        value = int(raw)
+    except ValueError:
+        return -1
+    if value <= 0:
+        return -1
+    return max(_CHUNK_GRANULE,
+               min(100 * 1024 * 1024, (value // _CHUNK_GRANULE) * _CHUNK_GRANULE))
+
+def _file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while block := f.read(1024 * 1024):
+            digest.update(block)
+        return digest.hexdigest()
+
+
+def _load_upload_cache() -> dict:
+    try:
+        return json.loads(UPLOAD_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+# Serializes the cache's load→mutate→replace: two batch threads finishing
+# together must not each load the old file and drop the other's entry.
+_upload_cache_lock = threading.Lock()
+
+
+def _record_upload(digest: str, video_id: str) -> None:
+    with _upload_cache_lock:
+        cache = _load_upload_cache()
+        cache[digest] = video_id
+        tmp = f"{UPLOAD_CACHE_FILE}.tmp"
+        Path(tmp).write_text(json.dumps(cache, indent=2))
+        os.replace(tmp, UPLOAD_CACHE_FILE)
+
+
+# Set by an orchestrator to abort retry backoffs early; the waits below
+# return immediately once this fires. In-flight HTTP requests themselves are
+# not interruptible.
+ABORT_EVENT = threading.Event()
+
+# The insert body always has exactly these two top-level parts.
+_PART_STRING = "snippet,status"
+
+# The description template has a single {fact} slot; split it once so each
+# build is plain concatenation — no format-spec parsing per upload, and
+# facts containing literal braces can't break .format.
+_DESC_PREFIX, _, _DESC_SUFFIX = YOUTUBE_DESCRIPTION_TEMPLATE.partition("{fact}")
+
+# Characters stripped from fact text before it goes into a title.
+_TITLE_STRIP = str.maketrans("", "", "<>\r\n\t")
+
+# API error reasons that are transient despite a 4xx status.
+_RETRYABLE_REASONS = ("rateLimitExceeded", "backendError")
+
+
+def _http_reason(exc) -> str:
+    try:
+        payload = json.loads(exc.content.decode("utf-8"))
+        return payload["error"]["errors"][0]["reason"]
+    except Exception:
+        return ""
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether an upload error is worth retrying.
+
+    Server-side 5xx, rate limiting, and network blips are transient;
+    auth, quota, and validation errors (400/401/403/404) will fail the
+    same way on every retry, so burning the backoff budget on them only
+    delays the failure signal.
+    """
+    from googleapiclient.errors import HttpError
+
+    if isinstance(exc, HttpError):
+        if exc.resp.status in (500, 502, 503, 504):
+            return True
+        return _http_reason(exc) in _RETRYABLE_REASONS
+    return isinstance(exc, (socket.timeout, TimeoutError, ConnectionError, ssl.SSLError))
+
+
+def _retry_after(exc: Exception) -> float | None:
+    """The server's Retry-After hint, if it sent one."""
+    from googleapiclient.errors import HttpError
+
+    if isinstance(exc, HttpError):
+        value = exc.resp.get("retry-after", "")
+        if value.isdigit():
+            return float(value)
+    return None
+
+# Refresh the access token this many seconds before it expires. Refreshing
+# on the boundary can fail an insert mid-resumable-upload and force a chunk
+# to be re-sent; a small skew window avoids the race entirely.
+TOKEN_REFRESH_SKEW_SECONDS = 60
+
+# Credentials are shared per process (lock-guarded); services are cached per
+# thread, because the httplib2 transport underneath is not thread-safe.
+_service_lock = threading.Lock()
+_service_cache: dict = {"creds": None, "saved_token": None, "services": []}
+_service_local = threading.local()
+
+
+# Lazily built transport for token refreshes: one keep-alive session to
+# oauth2.googleapis.com instead of a fresh Session (and TLS handshake) per
+# refresh. Only created/used under _service_lock.
+_auth_request = None
+
+
+def _get_auth_request():
+    global _auth_request
+    if _auth_request is None:
+        import requests
+        from google.auth.transport.requests import Request
+
+        session = requests.Session()
+        session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=1))
+        _auth_request = Request(session=session)
+    return _auth_request
+
+
+def _needs_refresh(creds) -> bool:
+    if not creds.token:
+        return True
+    if creds.expiry is None:
+        return creds.expired
+    remaining = (creds.expiry - datetime.utcnow()).total_seconds()
+    return remaining < TOKEN_REFRESH_SKEW_SECONDS
+
+
+@contextlib.contextmanager
+def _token_file_lock():
+    """Cross-process exclusive lock around token-file read/refresh/write."""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{TOKEN_FILE}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _save_token(creds) -> None:
+    """Atomically persist credentials (no torn reads for other processes)."""
+    tmp = f"{TOKEN_FILE}.tmp"
+    Path(tmp).write_text(creds.to_json())
+    os.replace(tmp, TOKEN_FILE)
+
+
+def _load_cached_access_token(creds) -> None:
+    """Adopt the previous run's access token if it matches our refresh token.
+
+    The env-var branch used to start tokenless every run, paying a token-
+    endpoint round trip even when the run seconds earlier had already
+    obtained a perfectly fresh access token.
+    """
+    try:
+        cached = json.loads(TOKEN_FILE.read_text())
+    except (OSError, ValueError):
+        return
+    if cached.get("refresh_token") != REFRESH_TOKEN or not cached.get("token"):
+        return
+    creds.token = cached["token"]
+    expiry = cached.get("expiry")
+    if expiry:
+        try:
+            creds.expiry = datetime.fromisoformat(
+                expiry.replace("Z", "+00:00")
+            ).replace(tzinfo=None)
+        except ValueError:
+            pass
+    _service_cache["saved_token"] = creds.token
+
+
+def _get_credentials():
+    """Load (and proactively refresh) the shared credentials."""
+    from google.oauth2.credentials import Credentials
+
+    with _service_lock, _token_file_lock():
+        creds = _service_cache["creds"]
+        if creds is None:
+            # Try loading from token file first (local dev)
+            if TOKEN_FILE.exists():
+                creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
+                _service_cache["saved_token"] = creds.token
+
+            # Try env-var refresh token (CI/CD)
+            if creds is None and REFRESH_TOKEN:
+                creds = Credentials(
+                    token=None,
+                    refresh_token=REFRESH_TOKEN,
+                    token_uri=TOKEN_URI,
+                    client_id=CLIENT_ID,
+                    client_secret=CLIENT_SECRET,
+                    scopes=SCOPES,
+                )
+                if TOKEN_FILE.exists():
+                    _load_cached_access_token(creds)
+
+        if creds is None:
+            raise RuntimeError(
+                "No YouTube credentials found. Set YOUTUBE_CLIENT_ID, "
+                "YOUTUBE_CLIENT_SECRET, and YOUTUBE_REFRESH_TOKEN env vars, "
+                "or run auth_setup.py to create youtube_token.json."
+            )
+
+        # Refresh proactively (inside the lock, so concurrent callers can't
+        # race each other into a double refresh)
+        if _needs_refresh(creds):
+            creds.refresh(_get_auth_request())
+        # Save the token locally, but only when it actually changed —
+        # no point rewriting the file on every call.
+        if creds.token and creds.token != _service_cache["saved_token"]:
+            _save_token(creds)
+            _service_cache["saved_token"] = creds.token
+
+        _service_cache["creds"] = creds
+        return creds
+
 
 def get_authenticated_service():
-    """Build an authenticated YouTube API service."""
-    creds = None
-
-    # Try loading from token file first (local dev)
-    if TOKEN_FILE.exists():
-        creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
-
-    # Try env-var refresh token (CI/CD)
-    if creds is None and REFRESH_TOKEN:
-        creds = Credentials(
-            token=None,
-            refresh_token=REFRESH_TOKEN,
-            token_uri=TOKEN_URI,
-            client_id=CLIENT_ID,
-            client_secret=CLIENT_SECRET,
-            scopes=SCOPES,
-        )
+    """Build an authenticated YouTube API service (cached per thread)."""
+    import google_auth_httplib2
+    import httplib2
+    from googleapiclient.discovery import build
 
-    if creds is None:
-        raise RuntimeError(
-            "No YouTube credentials found. Set YOUTUBE_CLIENT_ID, "
-            "YOUTUBE_CLIENT_SECRET, and YOUTUBE_REFRESH_TOKEN env vars, "
-            "or run auth_setup.py to create youtube_token.json."
-        )
+    service = getattr(_service_local, "service", None)
+    creds = _service_cache["creds"]
+    if service is not None and creds is not None and not _needs_refresh(creds):
+        return service
 
-    # Refresh if expired
-    if creds.expired or not creds.token:
-        creds.refresh(Request())
-        # Save refreshed token locally
-        TOKEN_FILE.write_text(creds.to_json())
+    creds = _get_credentials()
+    if service is None:
+        # One explicit keep-alive transport for the life of the service:
+        # discovery, the insert call, and every resumable chunk PUT reuse
+        # the same TLS connection instead of paying per-call handshakes.
+        # (httplib2 has no HTTP/2; connection reuse is the available win.)
+        # Refreshes mutate the shared creds in place, so existing services
+        # pick up new tokens automatically.
+        authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        # static_discovery pins the discovery document bundled with the
+        # client library: no HTTPS GET to discovery.googleapis.com per cold
+        # process, and no runtime dependency on that endpoint being up.
+        service = build("youtube", "v3", http=authed_http, static_discovery=True)
+        _service_local.service = service
+        with _service_lock:
+            _service_cache["services"].append(service)
+    return service
 
-    return build("youtube", "v3", credentials=creds)
+
+def close_service() -> None:
+    """Drop all cached services and release their HTTP connections."""
+    with _service_lock:
+        for service in _service_cache["services"]:
+            service.close()
+        _service_cache["services"] = []
+        _service_cache["creds"] = None
+    _service_local.service = None
+
+
+atexit.register(close_service)
 
 
 def upload_video(video_path: Path, episode_data: dict) -> str:
@@ -75,6 +350,17 @@ def upload_video(video_path: Path, episode_data: dict) -> str:
     Upload a video to YouTube as a Short.
     Returns the video ID on success.
     """
+    from googleapiclient.http import MediaIoBaseUpload
+
+    # Dedupe by content hash: a re-run over the same rendered file returns
+    # the already-published ID instead of uploading a duplicate.
+    digest = _file_sha256(video_path)
+    cached_id = _load_upload_cache().get(digest)
+    if cached_id:
+        print(f"[YouTubeUploader] Already uploaded (content match): "
+              f"https://youtube.com/shorts/{cached_id}")
+        return cached_id
+
     youtube = get_authenticated_service()
 
     episode = episode_data["episode"]
@@ -86,23 +372,29 @@ def upload_video(video_path: Path, episode_data: dict) -> str:
     title_prefix = episode_data.get("title_prefix", "Coffee Fact")
     # Grab a short snippet of the first fact for a unique title
     # Strip any leftover tags or weird characters
-    clean_text = fact_text.replace("<", "").replace(">", "")
+    clean_text = fact_text.translate(_TITLE_STRIP)
     snippet = clean_text.split(".")[0].split(",")[0].strip()
     if len(snippet) > 55:
         snippet = snippet[:52] + "..."
     # Fallback if snippet is empty or too short
     if len(snippet) < 5:
         snippet = "You Won't Believe This"
-    title = f"{title_prefix}: {snippet} #shorts"
 
-    # YouTube Shorts titles must be ≤100 chars and not empty
-    title = title[:100].strip()
-    if not title:
+    # YouTube titles must be ≤100 chars; budget the snippet up front so the
+    # prefix and "#shorts" always survive intact instead of slicing the
+    # assembled title and risking a chopped hashtag.
+    budget = 100 - len(title_prefix) - len(": ") - len(" #shorts")
+    if budget <= 5:
         title = "Caffeine Chronicles #shorts"
+    else:
+        title = f"{title_prefix}: {snippet[:budget]} #shorts"
 
-    # Build description with all facts listed
-    all_facts = "\n".join(f"☕ {t}" for t in texts if t)
-    description = YOUTUBE_DESCRIPTION_TEMPLATE.format(fact=all_facts)
+    # Build description with all facts listed — join on the separator-plus-
+    # prefix so each fact isn't formatted into its own temporary string
+    all_facts = "\n☕ ".join(t for t in texts if t)
+    if all_facts:
+        all_facts = "☕ " + all_facts
+    description = f"{_DESC_PREFIX}{all_facts}{_DESC_SUFFIX}"
 
     body = {
         "snippet": {
@@ -117,40 +409,68 @@ def upload_video(video_path: Path, episode_data: dict) -> str:
         },
     }
 
-    media = MediaFileUpload(
-        str(video_path),
-        mimetype="video/mp4",
-        resumable=True,
-        chunksize=1024 * 1024 * 8,  # 8 MB chunks
-    )
-
-    request = youtube.videos().insert(
-        part=",".join(body.keys()),
-        body=body,
-        media_body=media,
-    )
-
-    # Resumable upload with retry
-    video_id = None
-    retries = 0
-    response = None
-
-    print(f"[YouTubeUploader] Uploading: {title}")
-    while response is None:
-        try:
-            status, response = request.next_chunk()
-            if status:
-                pct = int(status.progress() * 100)
-                print(f"  ... {pct}% uploaded")
-        except Exception as e:
-            retries += 1
-            if retries > MAX_RETRIES:
-                raise RuntimeError(f"Upload failed after {MAX_RETRIES} retries: {e}")
-            wait = RETRY_BACKOFF ** retries
-            print(f"  [retry {retries}/{MAX_RETRIES}] Error: {e}. Waiting {wait}s...")
-            time.sleep(wait)
+    size = video_path.stat().st_size
+    resumable = size >= RESUMABLE_THRESHOLD
+
+    # Memory-map the file: the HTTP layer slices request bodies straight out
+    # of the page cache instead of read()ing chunks through intermediate
+    # bytes copies (mmap objects are seekable file-likes).
+    with open(video_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        chunk = _upload_chunk_size()
+        if chunk == -1 and size >= MAX_STREAM_SIZE:
+            chunk = 1024 * 1024 * 8  # chunk very large files rather than stream
+        media = MediaIoBaseUpload(
+            mm,
+            mimetype="video/mp4",
+            resumable=resumable,
+            chunksize=chunk,
+        )
+
+        request = youtube.videos().insert(
+            part=_PART_STRING,
+            body=body,
+            media_body=media,
+        )
+
+        print(f"[YouTubeUploader] Uploading: {title} ({size / 1e6:.1f} MB)")
+
+        # Small files go up as one multipart POST (no session setup or chunk
+        # loop); large ones stream chunk by chunk. Both share the transient
+        # retry loop — a single-shot POST hits the same 5xx/network blips.
+        retries = 0
+        response = None
+        last_reported = 0.0
+        while response is None:
+            try:
+                if not resumable:
+                    response = request.execute()
+                else:
+                    status, response = request.next_chunk()
+                    # Throttle progress to ~10 lines per upload; a print per
+                    # chunk is a write+flush syscall in a tight loop.
+                    if status and status.progress() - last_reported >= 0.1:
+                        last_reported = status.progress()
+                        print(f"  ... {int(last_reported * 100)}% uploaded")
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                retries += 1
+                if retries > MAX_RETRIES:
+                    raise RuntimeError(f"Upload failed after {MAX_RETRIES} retries: {e}")
+                # Full jitter so parallel CI jobs don't retry in lockstep,
+                # capped so late retries don't idle for half a minute.
+                wait = _retry_after(e) or (
+                    min(60, RETRY_BACKOFF ** retries) * (0.5 + random.random())
+                )
+                print(f"  [retry {retries}/{MAX_RETRIES}] Error: {e}. Waiting {wait:.1f}s...")
+                # Event.wait instead of time.sleep: interruptible by
+                # ABORT_EVENT and responsive to SIGINT during long waits.
+                if ABORT_EVENT.wait(wait):
+                    raise RuntimeError("Upload aborted during retry backoff")
 
     video_id = response["id"]
+    _record_upload(digest, video_id)
     video_url = f"https://youtube.com/shorts/{video_id}"
     print(f"[YouTubeUploader] Success! {video_url}")
 
@@ -162,6 +482,27 @@ def run(video_path: Path, episode_data: dict) -> str:
     return upload_video(video_path, episode_data)
 
 
+async def upload_video_async(video_path: Path, episode_data: dict) -> str:
+    """Await an upload without stalling the event loop.
+
+    The sync core runs in the default executor; pair with ABORT_EVENT to
+    cancel retry backoffs from the loop side.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, upload_video, video_path, episode_data)
+
+
+def run_batch(pairs: list[tuple[Path, dict]], max_workers: int = 4) -> list[str]:
+    """Upload several rendered episodes concurrently.
+
+    Each worker thread builds and caches its own service/transport (see
+    get_authenticated_service); results come back in input order. Keep
+    max_workers modest — YouTube limits concurrent uploads per channel.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda pair: upload_video(*pair), pairs))
+
+
 if __name__ == "__main__":
     # Manual test
     import sys